@@ -1,16 +1,22 @@
 import os
-import json
-import uuid
+import asyncio
 import httpx
-import random  # <<< Import random module
 import sys
-from typing import Any
+import logging
+import importlib.util
 from dotenv import load_dotenv
 from dataclasses import dataclass
 from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator
 
-from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp import FastMCP
+
+# Use uvloop for the event loop if it is installed (optional, not available on Windows)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
 
 # Import tools and prompts
 import tools
@@ -21,19 +27,36 @@ from prompts import (
 )
 
 # --- Configuration ---
+
+# Log through the logging module: stdout carries the MCP stdio transport, so print() would corrupt it
+logger = logging.getLogger("masumi")
+
 load_dotenv()  # Load variables from .env file
 
-# Load base URLs from environment variables
-MASUMI_REGISTRY_BASE_URL = os.getenv('MASUMI_REGISTRY_BASE_URL')
-MASUMI_PAYMENT_BASE_URL = os.getenv('MASUMI_PAYMENT_BASE_URL')
+@dataclass(frozen=True, slots=True)
+class _Env:
+    """Environment settings, read once at import."""
+    registry_base_url: str
+    payment_base_url: str
+    registry_token: str
+    payment_token: str
+    network: str
+
+_ENV = _Env(
+    registry_base_url=os.getenv('MASUMI_REGISTRY_BASE_URL') or "",
+    payment_base_url=os.getenv('MASUMI_PAYMENT_BASE_URL') or "",
+    registry_token=os.getenv('MASUMI_REGISTRY_TOKEN') or "",
+    payment_token=os.getenv('MASUMI_PAYMENT_TOKEN') or "",
+    network=os.getenv('MASUMI_NETWORK', 'Preprod'),  # Default to Preprod
+)
 
 # Validate required configuration
-if not MASUMI_REGISTRY_BASE_URL:
-    print("ERROR: MASUMI_REGISTRY_BASE_URL not defined in .env file")
+if not _ENV.registry_base_url:
+    logger.error("MASUMI_REGISTRY_BASE_URL not defined in .env file")
     sys.exit(1)
     
-if not MASUMI_PAYMENT_BASE_URL:
-    print("ERROR: MASUMI_PAYMENT_BASE_URL not defined in .env file")
+if not _ENV.payment_base_url:
+    logger.error("MASUMI_PAYMENT_BASE_URL not defined in .env file")
     sys.exit(1)
 
 # API paths
@@ -41,15 +64,17 @@ REGISTRY_API_PATH = 'api/v1/registry-entry/'
 PAYMENT_API_PATH = 'api/v1/purchase/'
 
 # Full URLs - ensure we don't have double slashes
-MASUMI_REGISTRY_URL = f"{MASUMI_REGISTRY_BASE_URL.rstrip('/')}/{REGISTRY_API_PATH}"
-MASUMI_PAYMENT_URL = f"{MASUMI_PAYMENT_BASE_URL.rstrip('/')}/{PAYMENT_API_PATH}"
+MASUMI_REGISTRY_URL = f"{_ENV.registry_base_url.rstrip('/')}/{REGISTRY_API_PATH}"
+MASUMI_PAYMENT_URL = f"{_ENV.payment_base_url.rstrip('/')}/{PAYMENT_API_PATH}"
 
 # Set URLs in tools module
 tools.set_urls(MASUMI_REGISTRY_URL, MASUMI_PAYMENT_URL)
 
 # --- Lifespan Management & Context ---
 
-@dataclass
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+@dataclass(frozen=True, slots=True)
 class MasumiContext:
     """Holds shared resources needed by the server."""
     http_client: httpx.AsyncClient
@@ -62,27 +87,30 @@ async def masumi_lifespan(server: FastMCP) -> AsyncIterator[MasumiContext]:
     """
     Manages the application lifecycle: initialize resources on startup, clean up on shutdown.
     """
-    registry_token = os.getenv("MASUMI_REGISTRY_TOKEN")
-    payment_token = os.getenv("MASUMI_PAYMENT_TOKEN")
-    network = os.getenv("MASUMI_NETWORK", "Preprod") # Default to Preprod
-
-    print("--- Masumi MCP Server Starting ---")
-    if not registry_token:
-        print("WARNING: MASUMI_REGISTRY_TOKEN not found in .env. Registry features will fail.")
-    if not payment_token:
-        print("WARNING: MASUMI_PAYMENT_TOKEN not found in .env. Payment features will fail.")
-    print(f"Using Masumi Network: {network}")
-
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    logger.info("--- Masumi MCP Server Starting ---")
+    if not _ENV.registry_token:
+        logger.warning("MASUMI_REGISTRY_TOKEN not found in .env. Registry features will fail.")
+    if not _ENV.payment_token:
+        logger.warning("MASUMI_PAYMENT_TOKEN not found in .env. Payment features will fail.")
+    logger.info("Using Masumi Network: %s", _ENV.network)
+
+    tools.set_headers(_ENV.registry_token, _ENV.payment_token)
+
+    # Keep connections to the registry, payment service and agents alive between tool calls.
+    # HTTP/2 is only enabled when the optional 'h2' package is installed.
+    limits = httpx.Limits(max_keepalive_connections=100, max_connections=200, keepalive_expiry=60)
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=limits, retries=1)
+
+    async with httpx.AsyncClient(timeout=30.0, transport=transport) as client:
         try:
             yield MasumiContext(
                 http_client=client,
-                registry_token=registry_token or "",
-                payment_token=payment_token or "",
-                network=network
+                registry_token=_ENV.registry_token,
+                payment_token=_ENV.payment_token,
+                network=_ENV.network
             )
         finally:
-            print("--- Masumi MCP Server Shutting Down ---")
+            logger.info("--- Masumi MCP Server Shutting Down ---")
 
 
 # --- MCP Server Initialization ---
@@ -93,20 +121,15 @@ mcp = FastMCP(
 )
 
 # Register tools
-mcp.tool()(list_agents)
-mcp.tool()(get_agent_input_schema)
-mcp.tool()(hire_agent)
-mcp.tool()(check_job_status)
-mcp.tool()(get_job_full_result)
+for tool_fn in (list_agents, get_agent_input_schema, hire_agent, check_job_status, get_job_full_result):
+    mcp.add_tool(tool_fn)
 
 # Register prompts
-mcp.prompt()(prompt_list_agents)
-mcp.prompt()(prompt_get_agent_input_schema)
-mcp.prompt()(prompt_hire_agent)
-mcp.prompt()(prompt_check_job_status)
-mcp.prompt()(prompt_get_job_full_result)
+for prompt_fn in (prompt_list_agents, prompt_get_agent_input_schema, prompt_hire_agent,
+                  prompt_check_job_status, prompt_get_job_full_result):
+    mcp.prompt()(prompt_fn)
 
 # --- Main Execution ---
 if __name__ == "__main__":
-    print("Starting Masumi MCP Server...")
+    logger.info("Starting Masumi MCP Server...")
     mcp.run()
\ No newline at end of file
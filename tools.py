@@ -1,10 +1,7 @@
-import os
 import json
-import uuid
 import httpx
 import random
-import sys
-from typing import Any, List, Tuple
+from typing import Any, List
 
 from mcp.server.fastmcp import Context
 
@@ -12,11 +9,22 @@ from mcp.server.fastmcp import Context
 MASUMI_REGISTRY_URL = None
 MASUMI_PAYMENT_URL = None
 
+# Request headers, built once instead of per tool call
+REGISTRY_HEADERS = {}
+PAYMENT_HEADERS = {}
+JSON_ACCEPT_HEADERS = {'accept': 'application/json'}
+JSON_POST_HEADERS = {'accept': 'application/json', 'Content-Type': 'application/json'}
+
 def set_urls(registry_url: str, payment_url: str):
     global MASUMI_REGISTRY_URL, MASUMI_PAYMENT_URL
     MASUMI_REGISTRY_URL = registry_url
     MASUMI_PAYMENT_URL = payment_url
 
+def set_headers(registry_token: str, payment_token: str):
+    global REGISTRY_HEADERS, PAYMENT_HEADERS
+    REGISTRY_HEADERS = {'accept': 'application/json', 'token': registry_token, 'Content-Type': 'application/json'}
+    PAYMENT_HEADERS = {'accept': 'application/json', 'token': payment_token, 'Content-Type': 'application/json'}
+
 # --- Helper functions ---
 
 def split_large_content(content: str, max_size: int = 4000) -> List[str]:
@@ -74,12 +82,11 @@ async def list_agents(ctx: Context) -> str:
         ctx.error("Masumi Registry Token is not configured.")
         return "Error: Masumi Registry Token is not configured."
 
-    headers = {'accept': 'application/json', 'token': m_ctx.registry_token, 'Content-Type': 'application/json'}
     payload = {"limit": 50, "network": m_ctx.network}
     ctx.info(f"Fetching agents from registry (Tool: list_agents, Network: {m_ctx.network}, Limit: {payload['limit']})")
 
     try:
-        response = await client.post(MASUMI_REGISTRY_URL, headers=headers, json=payload)
+        response = await client.post(MASUMI_REGISTRY_URL, headers=REGISTRY_HEADERS, json=payload)
         response.raise_for_status()
         data = response.json()
 
@@ -124,11 +131,10 @@ async def get_agent_input_schema(ctx: Context, agent_identifier: str, api_base_u
         api_base_url += '/'
 
     schema_url = f"{api_base_url}input_schema"
-    schema_headers = {'accept': 'application/json'}
 
     try:
         ctx.info(f"Calling agent input_schema endpoint: {schema_url}")
-        schema_response = await client.get(schema_url, headers=schema_headers)
+        schema_response = await client.get(schema_url, headers=JSON_ACCEPT_HEADERS)
         schema_response.raise_for_status()
         schema_data = schema_response.json()
 
@@ -206,7 +212,7 @@ async def hire_agent(ctx: Context, agent_identifier: str, api_base_url: str, inp
     start_job_url = f"{api_base_url}start_job"
 
     # Generate identifier in requested format
-    random_suffix = "".join([str(random.randint(0, 9)) for _ in range(3)])
+    random_suffix = f"{random.randrange(1000):03d}"
     identifier_from_purchaser = f"example_purchaser_{random_suffix}"
     ctx.info(f"Generated identifier_from_purchaser: {identifier_from_purchaser}")
 
@@ -214,7 +220,6 @@ async def hire_agent(ctx: Context, agent_identifier: str, api_base_url: str, inp
         "identifier_from_purchaser": identifier_from_purchaser,
         "input_data": input_data
     }
-    start_job_headers = {'accept': 'application/json', 'Content-Type': 'application/json'}
     job_id = None
 
     try:
@@ -234,7 +239,7 @@ async def hire_agent(ctx: Context, agent_identifier: str, api_base_url: str, inp
 
     try:
         ctx.info(f"Calling start_job for {agent_identifier} at {start_job_url}")
-        start_job_response = await client.post(start_job_url, headers=start_job_headers, json=start_job_payload)
+        start_job_response = await client.post(start_job_url, headers=JSON_POST_HEADERS, json=start_job_payload)
         ctx.info(f"/start_job response status code: {start_job_response.status_code}")
 
         if start_job_response.status_code == 400:
@@ -295,7 +300,6 @@ async def hire_agent(ctx: Context, agent_identifier: str, api_base_url: str, inp
         return f"Error: {error_msg}"
 
     # --- Step 3: Call Payment Service /purchase ---
-    payment_headers = {'accept': 'application/json', 'token': m_ctx.payment_token, 'Content-Type': 'application/json'}
     payment_payload = {
           "identifierFromPurchaser": identifier_from_purchaser,
           "blockchainIdentifier": blockchain_identifier,
@@ -311,7 +315,7 @@ async def hire_agent(ctx: Context, agent_identifier: str, api_base_url: str, inp
 
     try:
         ctx.info(f"Calling payment service ({MASUMI_PAYMENT_URL}) for job {job_id}")
-        payment_response = await client.post(MASUMI_PAYMENT_URL, headers=payment_headers, json=payment_payload)
+        payment_response = await client.post(MASUMI_PAYMENT_URL, headers=PAYMENT_HEADERS, json=payment_payload)
         ctx.info(f"/purchase response status code: {payment_response.status_code}")
 
         payment_response.raise_for_status()
@@ -363,11 +367,10 @@ async def get_job_full_result(ctx: Context, agent_identifier: str, api_base_url:
         api_base_url += '/'
 
     status_url = f"{api_base_url}status"
-    status_headers = {'accept': 'application/json'}
     params = {'job_id': job_id}
 
     try:
-        status_response = await client.get(status_url, headers=status_headers, params=params)
+        status_response = await client.get(status_url, headers=JSON_ACCEPT_HEADERS, params=params)
         status_response.raise_for_status()
         status_data = status_response.json()
         result = status_data.get("result", None)
@@ -414,12 +417,11 @@ async def check_job_status(ctx: Context, agent_identifier: str, api_base_url: st
         api_base_url += '/'
 
     status_url = f"{api_base_url}status"
-    status_headers = {'accept': 'application/json'}
     params = {'job_id': job_id}
 
     try:
         ctx.info(f"Calling agent status endpoint: {status_url} for job {job_id}")
-        status_response = await client.get(status_url, headers=status_headers, params=params)
+        status_response = await client.get(status_url, headers=JSON_ACCEPT_HEADERS, params=params)
         status_response.raise_for_status()
         status_data = status_response.json()
 